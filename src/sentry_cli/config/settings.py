@@ -1,12 +1,21 @@
 """Settings configuration with environment variable loading from ~/.claude/.env and ./.env"""
+import functools
+import os
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+# .env files in priority order (highest first)
+ENV_FILES = (
+    Path.home() / ".claude" / ".env",  # User-level for all AI assistants
+    Path(".env"),                      # Project-level
+)
 
+_TRUE_VALUES = {"1", "true", "yes", "on"}
 
-class Settings(BaseSettings):
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     """
     Application settings loaded from environment variables and .env files.
 
@@ -17,59 +26,115 @@ class Settings(BaseSettings):
     4. Default values
     """
 
-    model_config = SettingsConfigDict(
-        env_file=[
-            Path.home() / ".claude" / ".env",  # User-level for all AI assistants
-            ".env",                            # Project-level
-        ],
-        env_file_encoding="utf-8",
-        case_sensitive=False,
-        extra="ignore",
-    )
-
     # Sentry configuration
-    sentry_access_token: str = Field(
-        ...,
-        description="Sentry API access token (required)",
-    )
-    sentry_host: str = Field(
-        default="sentry.io",
-        description="Sentry host for self-hosted instances",
-    )
-    sentry_default_org: Optional[str] = Field(
-        default=None,
-        description="Default organization slug",
-    )
-    sentry_default_project: Optional[str] = Field(
-        default=None,
-        description="Default project slug",
-    )
+    sentry_access_token: str                    # Sentry API access token (required)
+    sentry_host: str = "sentry.io"              # Sentry host for self-hosted instances
+    sentry_default_org: Optional[str] = None    # Default organization slug
+    sentry_default_project: Optional[str] = None  # Default project slug
+
+    # MCP server (pin a version, or point at a local install to skip npx)
+    sentry_mcp_server_version: str = "latest"   # @sentry/mcp-server version spawned via npx
+    sentry_mcp_server_path: Optional[str] = None  # Path to a locally installed server binary
 
     # OpenAI configuration (optional - enables AI-powered search)
-    openai_api_key: Optional[str] = Field(
-        default=None,
-        description="OpenAI API key for search_events and search_issues tools",
-    )
+    openai_api_key: Optional[str] = None        # For search_events and search_issues tools
 
     # Output preferences (optimized for AI assistants)
-    output_format: str = Field(
-        default="json",
-        description="Default output format: json, table, or compact",
-    )
-    output_color: bool = Field(
-        default=False,
-        description="Enable colored output (disabled by default for AI assistants)",
-    )
+    output_format: str = "json"                 # Default output format: json, table, or compact
+    output_color: bool = False                  # Colored output (disabled by default for AI assistants)
+
+
+def _parse_env_value(raw: str) -> str:
+    """Strip quotes or a trailing inline comment from the text after '='."""
+    value = raw.strip()
+    if value[:1] in ("'", '"'):
+        end = value.find(value[0], 1)
+        if end != -1:
+            return value[1:end]
+
+    # Unquoted: a '#' preceded by whitespace starts a comment
+    for i, char in enumerate(raw):
+        if char == "#" and i and raw[i - 1].isspace():
+            return raw[:i].strip()
+    return value
+
+
+def _parse_env_file(path: Path) -> Dict[str, str]:
+    """
+    Parse a .env file into a dict of raw string values.
+
+    Supports ``KEY=value`` lines, an optional ``export`` prefix, full-line and
+    inline ``#`` comments, and single- or double-quoted values (which end at
+    the matching closing quote). Missing files yield an empty dict.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return {}
 
+    values = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip().removeprefix("export ").strip()
+        values[key] = _parse_env_value(value)
+    return values
 
+
+def _load_settings() -> Settings:
+    """
+    Build Settings from os.environ, then ~/.claude/.env, then ./.env.
+
+    When a non-empty SENTRY_ACCESS_TOKEN is exported (CI, deployed agents) the
+    shell environment is treated as authoritative and no .env file is read.
+    Empty values are treated as unset, so an exported ``VAR=`` does not hide
+    a value from a .env file.
+
+    Variable names are case-sensitive: only the uppercase form of each field
+    (e.g. SENTRY_HOST) is recognised, so each name is a direct lookup rather
+    than a scan of the whole environment.
+    """
+    raw: Dict[str, str] = {}
+
+    # Look each name up from highest to lowest priority; first non-empty hit wins
+    sources = [os.environ]
+    if not os.environ.get("SENTRY_ACCESS_TOKEN"):
+        sources.extend(_parse_env_file(path) for path in ENV_FILES)
+    for field in fields(Settings):
+        env_name = field.name.upper()
+        for source in sources:
+            if source.get(env_name):
+                raw[field.name] = source[env_name]
+                break
+
+    if not raw.get("sentry_access_token"):
+        raise RuntimeError(
+            "SENTRY_ACCESS_TOKEN is not set. Add it to ~/.claude/.env or ./.env, "
+            "or export it in your shell."
+        )
+
+    values: Dict[str, object] = dict(raw)
+    if "output_color" in raw:
+        values["output_color"] = raw["output_color"].strip().lower() in _TRUE_VALUES
+    return Settings(**values)
+
+
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get application settings.
 
+    The result is cached so the .env files are parsed once per process.
+    Call ``get_settings.cache_clear()`` to force a reload.
+
     Returns:
         Settings instance with configuration loaded from env vars and .env files
 
     Raises:
-        ValidationError: If required settings (like sentry_access_token) are missing
+        RuntimeError: If required settings (like SENTRY_ACCESS_TOKEN) are missing
     """
-    return Settings()
+    return _load_settings()
@@ -1,34 +1,105 @@
 """Main entry point for Sentry MCP CLI"""
-import asyncio
+import dataclasses
+import functools
 import json
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, TypeVar
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install 'sentry-mcp-cli[fast]'
+    orjson = None
 
 from sentry_cli.config.settings import Settings, get_settings
-from sentry_cli.mcp.connector import list_all_tools
+from sentry_cli.mcp.connector import SentryMCPConnector, list_cached_tools
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+T = TypeVar("T")
+
+
+# rich is imported on first use so --json output never loads it
+@functools.lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Get the shared console for rich output"""
+    from rich.console import Console
+
+    return Console()
+
+
+def _dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def print_json(ctx: typer.Context, obj) -> None:
+    """Write obj to stdout as JSON, compact unless --pretty was given"""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_dumps(obj, pretty=ctx.obj.get("pretty")) + b"\n")
+
+
+def _short(text: str, limit: int = 80) -> str:
+    """Truncate text for table display"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def rprint(*objects, **kwargs) -> None:
+    """Print with rich markup, importing rich lazily"""
+    from rich import print as rich_print
+
+    rich_print(*objects, **kwargs)
+
+
+def run_cli(settings: Settings, func: Callable[[SentryMCPConnector], Awaitable[T]]) -> T:
+    """
+    Run an async command body against a single MCP connection.
+
+    The server subprocess is spawned on first use, shared by every call made
+    through the connector passed to ``func``, and shut down when ``func``
+    returns. Nothing is spawned if ``func`` never touches the connector.
+
+    ``func`` runs on a single asyncio.Runner event loop, so it may await any
+    number of MCP calls without the loop or session being torn down between them.
+    """
+    import asyncio
+
+    async def _run() -> T:
+        connector = SentryMCPConnector(settings)
+        try:
+            return await func(connector)
+        finally:
+            await connector.close()
+
+    with asyncio.Runner() as runner:
+        return runner.run(_run())
+
 
 # Helper function to find a specific tool
-async def get_tool_by_name(settings: Settings, tool_name: str):
+async def get_tool_by_name(
+    settings: Settings,
+    tool_name: str,
+    connector: Optional[SentryMCPConnector] = None,
+    use_cache: bool = True,
+):
     """Get a specific tool by name from the MCP server"""
-    tools = await list_all_tools(settings)
+    tools = await list_cached_tools(settings, connector, use_cache=use_cache)
 
     # Find exact match first
-    for tool in tools:
-        if tool.name == tool_name:
-            return tool
+    by_name = {tool.name: tool for tool in tools}
+    tool = by_name.get(tool_name)
+    if tool:
+        return tool
 
     # Try fuzzy match (replace hyphens with underscores and vice versa)
-    normalized_name = tool_name.replace("-", "_")
-    for tool in tools:
-        if tool.name.replace("-", "_") == normalized_name:
-            return tool
-
-    return None
+    by_normalized_name = {name.replace("-", "_"): tool for name, tool in by_name.items()}
+    return by_normalized_name.get(tool_name.replace("-", "_"))
 
 # Create the main Typer app
 app = typer.Typer(
@@ -37,10 +108,6 @@ app = typer.Typer(
     add_completion=False,
 )
 
-# Global console for rich output
-console = Console()
-
-
 # Callback for global options
 @app.callback()
 def main(
@@ -72,6 +139,16 @@ def main(
         "--org",
         help="Default organization slug (overrides config)",
     ),
+    pretty: bool = typer.Option(
+        False,
+        "--pretty",
+        help="Indent JSON output for human readers",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the cached tool list and query the MCP server",
+    ),
 ):
     """
     Global options for all commands.
@@ -85,6 +162,8 @@ def main(
     ctx.obj["quiet"] = quiet
     ctx.obj["no_interactive"] = no_interactive
     ctx.obj["org"] = org
+    ctx.obj["pretty"] = pretty
+    ctx.obj["no_cache"] = no_cache
 
 
 @app.command(name="list-tools")
@@ -106,119 +185,214 @@ def list_tools(
 
         # Override settings with global options
         if ctx.obj.get("org"):
-            settings.sentry_default_org = ctx.obj["org"]
+            settings = dataclasses.replace(settings, sentry_default_org=ctx.obj["org"])
 
         # Run async function to list tools
-        tools = asyncio.run(list_all_tools(settings))
+        tools = run_cli(
+            settings,
+            lambda connector: list_cached_tools(
+                settings, connector, use_cache=not ctx.obj.get("no_cache")
+            ),
+        )
 
         # Output based on format
         if ctx.obj.get("json"):
             # JSON output for AI assistants
-            output = {
-                "tools": [
-                    {
-                        "name": tool.name,
-                        "description": tool.description,
-                    }
-                    for tool in tools
-                ],
-                "total": len(tools),
-            }
-            print(json.dumps(output, indent=2))
+            if ctx.obj.get("pretty"):
+                print_json(ctx, {
+                    "tools": [
+                        {"name": tool.name, "description": tool.description}
+                        for tool in tools
+                    ],
+                    "total": len(tools),
+                })
+            else:
+                # Stream one tool at a time instead of building the whole document
+                sys.stdout.flush()
+                write = sys.stdout.buffer.write
+                write(b'{"tools":[')
+                for i, tool in enumerate(tools):
+                    if i:
+                        write(b",")
+                    write(_dumps({"name": tool.name, "description": tool.description}))
+                write(b'],"total":%d}\n' % len(tools))
         else:
             # Human-readable output
+            from rich.table import Table
+
             rprint(f"\n[bold]Available Sentry MCP Tools ({len(tools)}):[/bold]\n")
 
             table = Table(show_header=True, header_style="bold cyan")
             table.add_column("Tool Name", style="green")
             table.add_column("Description")
 
-            for tool in tools:
-                table.add_row(
-                    tool.name,
-                    tool.description[:80] + "..." if len(tool.description) > 80 else tool.description
-                )
+            rows = [(tool.name, _short(tool.description)) for tool in tools]
+            for name, description in rows:
+                table.add_row(name, description)
 
-            console.print(table)
+            _console().print(table)
             rprint("\n[dim]Use 'sentry describe-tool <name>' for detailed information.[/dim]\n")
 
     except Exception as e:
         if ctx.obj.get("json"):
-            print(json.dumps({"error": str(e)}, indent=2))
+            print_json(ctx, {"error": str(e)})
         else:
             rprint(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
-@app.command(name="describe-tool")
-def describe_tool(
+# Fields that can be selected with `sentry tool --fields`
+TOOL_FIELDS = ("name", "description", "inputSchema")
+
+
+def _show_tool(
     ctx: typer.Context,
-    tool_name: str = typer.Argument(..., help="Name of the tool to describe"),
+    tool_name: str,
+    schema: bool = False,
+    fields: Optional[str] = None,
 ):
     """
-    Show detailed documentation for a specific Sentry MCP tool.
+    Resolve a tool once and render its summary, full schema, or selected fields.
 
-    This command provides Tier 2 progressive disclosure - showing full description,
-    parameters, and usage examples for a specific tool (~200 tokens).
-
-    Example:
-        sentry describe-tool find-organizations
-        sentry describe-tool get-issue-details --json
+    Shared by 'tool', 'describe-tool' and 'tool-schema' so every view of a tool
+    comes from the same (cached) lookup.
     """
     try:
+        # Validate --fields before touching the server
+        selected = None
+        if fields and schema:
+            raise ValueError("--schema and --fields cannot be used together")
+        if fields:
+            selected = [field.strip() for field in fields.split(",") if field.strip()]
+            unknown = [field for field in selected if field not in TOOL_FIELDS]
+            if unknown:
+                raise ValueError(
+                    f"Unknown field(s): {', '.join(unknown)}. "
+                    f"Choose from: {', '.join(TOOL_FIELDS)}"
+                )
+
         # Get settings
         settings = get_settings()
 
         # Find the tool
-        tool = asyncio.run(get_tool_by_name(settings, tool_name))
+        tool = run_cli(
+            settings,
+            lambda connector: get_tool_by_name(
+                settings, tool_name, connector, use_cache=not ctx.obj.get("no_cache")
+            ),
+        )
 
         if not tool:
             if ctx.obj.get("json"):
-                print(json.dumps({
+                print_json(ctx, {
                     "error": f"Tool '{tool_name}' not found",
                     "hint": "Run 'sentry list-tools' to see available tools"
-                }, indent=2))
+                })
             else:
                 rprint(f"[red]Error:[/red] Tool '{tool_name}' not found")
                 rprint(f"[dim]Run 'sentry list-tools' to see available tools[/dim]")
             sys.exit(1)
 
-        # Output based on format
-        if ctx.obj.get("json"):
-            # JSON output for AI assistants
-            output = {
+        input_schema = getattr(tool, "inputSchema", None)
+
+        if selected:
+            # Always output selected fields as JSON
+            values = {
                 "name": tool.name,
                 "description": tool.description,
-                "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else None,
+                "inputSchema": input_schema,
             }
-            print(json.dumps(output, indent=2))
+            print_json(ctx, {field: values[field] for field in selected})
+        elif schema:
+            # Always output JSON schema
+            print_json(ctx, {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": input_schema if input_schema is not None else {},
+            })
+        elif ctx.obj.get("json"):
+            # JSON output for AI assistants
+            print_json(ctx, {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": input_schema,
+            })
         else:
             # Human-readable output
             rprint(f"\n[bold cyan]Tool:[/bold cyan] {tool.name}\n")
             rprint(f"[bold]Description:[/bold]")
             rprint(f"{tool.description}\n")
 
-            if hasattr(tool, "inputSchema") and tool.inputSchema:
-                schema = tool.inputSchema
-                if isinstance(schema, dict) and "properties" in schema:
-                    rprint("[bold]Parameters:[/bold]")
-                    for param_name, param_info in schema.get("properties", {}).items():
-                        required = param_name in schema.get("required", [])
-                        req_marker = "[red]*[/red]" if required else " "
-                        param_desc = param_info.get("description", "No description")
-                        param_type = param_info.get("type", "any")
-                        rprint(f"  {req_marker} [green]{param_name}[/green] ({param_type}): {param_desc}")
+            if input_schema and isinstance(input_schema, dict) and "properties" in input_schema:
+                rprint("[bold]Parameters:[/bold]")
+                for param_name, param_info in input_schema.get("properties", {}).items():
+                    required = param_name in input_schema.get("required", [])
+                    req_marker = "[red]*[/red]" if required else " "
+                    param_desc = param_info.get("description", "No description")
+                    param_type = param_info.get("type", "any")
+                    rprint(f"  {req_marker} [green]{param_name}[/green] ({param_type}): {param_desc}")
 
-            rprint(f"\n[dim]Full schema: sentry tool-schema {tool.name}[/dim]\n")
+            rprint(f"\n[dim]Full schema: sentry tool {tool.name} --schema[/dim]\n")
 
     except Exception as e:
         if ctx.obj.get("json"):
-            print(json.dumps({"error": str(e)}, indent=2))
+            print_json(ctx, {"error": str(e)})
         else:
             rprint(f"[red]Error:[/red] {e}")
         sys.exit(1)
 
 
+@app.command(name="tool")
+def tool(
+    ctx: typer.Context,
+    tool_name: str = typer.Argument(..., help="Name of the tool"),
+    schema: bool = typer.Option(
+        False,
+        "--schema",
+        help="Show the complete JSON schema (Tier 3)",
+    ),
+    fields: Optional[str] = typer.Option(
+        None,
+        "--fields",
+        help=(
+            f"Comma-separated fields to output as JSON ({', '.join(TOOL_FIELDS)}); "
+            "cannot be combined with --schema"
+        ),
+    ),
+):
+    """
+    Show a Sentry MCP tool's description, parameters, or full schema.
+
+    Covers Tier 2 (default) and Tier 3 (--schema) progressive disclosure from a
+    single tool lookup, served from the tool cache when fresh.
+
+    Example:
+        sentry tool get-issue-details
+        sentry tool get-issue-details --schema
+        sentry tool get-issue-details --fields name,inputSchema
+    """
+    _show_tool(ctx, tool_name, schema=schema, fields=fields)
+
+
+@app.command(name="describe-tool")
+def describe_tool(
+    ctx: typer.Context,
+    tool_name: str = typer.Argument(..., help="Name of the tool to describe"),
+):
+    """
+    Show detailed documentation for a specific Sentry MCP tool.
+
+    This command provides Tier 2 progressive disclosure - showing full description,
+    parameters, and usage examples for a specific tool (~200 tokens).
+    Alias for 'sentry tool <name>'.
+
+    Example:
+        sentry describe-tool find-organizations
+        sentry describe-tool get-issue-details --json
+    """
+    _show_tool(ctx, tool_name)
+
+
 @app.command(name="tool-schema")
 def tool_schema(
     ctx: typer.Context,
@@ -229,43 +403,13 @@ def tool_schema(
 
     This command provides Tier 3 progressive disclosure - showing the full
     JSON schema including all parameters, types, and constraints (~500 tokens).
+    Alias for 'sentry tool <name> --schema'.
 
     Example:
         sentry tool-schema find-organizations
         sentry tool-schema get-issue-details
     """
-    try:
-        # Get settings
-        settings = get_settings()
-
-        # Find the tool
-        tool = asyncio.run(get_tool_by_name(settings, tool_name))
-
-        if not tool:
-            if ctx.obj.get("json"):
-                print(json.dumps({
-                    "error": f"Tool '{tool_name}' not found",
-                    "hint": "Run 'sentry list-tools' to see available tools"
-                }, indent=2))
-            else:
-                rprint(f"[red]Error:[/red] Tool '{tool_name}' not found")
-                rprint(f"[dim]Run 'sentry list-tools' to see available tools[/dim]")
-            sys.exit(1)
-
-        # Always output JSON schema
-        schema = {
-            "name": tool.name,
-            "description": tool.description,
-            "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
-        }
-        print(json.dumps(schema, indent=2))
-
-    except Exception as e:
-        if ctx.obj.get("json"):
-            print(json.dumps({"error": str(e)}, indent=2))
-        else:
-            rprint(f"[red]Error:[/red] {e}")
-        sys.exit(1)
+    _show_tool(ctx, tool_name, schema=True)
 
 
 # Entry point for CLI
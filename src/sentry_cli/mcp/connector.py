@@ -1,12 +1,31 @@
 """MCP stdio connection manager for Sentry MCP server"""
-import asyncio
-from typing import Any, Dict, List, Optional
-
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from sentry_cli.config.settings import Settings
 
+if TYPE_CHECKING:
+    # The mcp SDK is slow to import; load it only when a server is spawned
+    from mcp import ClientSession, StdioServerParameters
+
+# npm package spawned via npx
+SENTRY_MCP_SERVER_PACKAGE = "@sentry/mcp-server"
+
+# How long a cached tool list stays fresh (seconds)
+TOOLS_CACHE_TTL = 86400
+
+
+def _server_package_spec(settings: Settings) -> str:
+    """npm package spec for the configured server version, e.g. @sentry/mcp-server@latest"""
+    return f"{SENTRY_MCP_SERVER_PACKAGE}@{settings.sentry_mcp_server_version}"
+
 
 class SentryMCPConnector:
     """
@@ -14,6 +33,13 @@ class SentryMCPConnector:
 
     Automatically spawns the Sentry MCP server as a subprocess using npx
     and establishes a stdio connection.
+
+    Use as an async context manager to keep one server subprocess and session
+    open for several calls:
+
+        async with SentryMCPConnector(settings) as connector:
+            tools = await connector.list_tools()
+            result = await connector.call_tool("whoami", {})
     """
 
     def __init__(self, settings: Settings):
@@ -24,18 +50,27 @@ class SentryMCPConnector:
             settings: Application settings with Sentry credentials
         """
         self.settings = settings
-        self._session: Optional[ClientSession] = None
+        self._session: Optional["ClientSession"] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+
+    async def __aenter__(self) -> "SentryMCPConnector":
+        await self.connect()
+        return self
 
-    def _build_server_params(self) -> StdioServerParameters:
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _build_server_params(self) -> "StdioServerParameters":
         """
         Build server parameters for spawning Sentry MCP server.
 
         Returns:
             StdioServerParameters configured for Sentry MCP server
         """
-        # Base command and args
+        from mcp import StdioServerParameters
+
+        # Base args
         args = [
-            "@sentry/mcp-server@latest",
             "--access-token",
             self.settings.sentry_access_token,
         ]
@@ -53,17 +88,33 @@ class SentryMCPConnector:
         if self.settings.openai_api_key:
             env["OPENAI_API_KEY"] = self.settings.openai_api_key
 
+        # Spawn a locally installed server directly to skip npx entirely
+        if self.settings.sentry_mcp_server_path:
+            return StdioServerParameters(
+                command=self.settings.sentry_mcp_server_path,
+                args=args,
+                env=env,
+            )
+
+        # For a pinned version, --prefer-offline lets npx use its cache instead
+        # of querying the registry. "latest" must be revalidated, or it would
+        # stay frozen at whichever version was cached first.
+        npx_args = [_server_package_spec(self.settings), *args]
+        if self.settings.sentry_mcp_server_version != "latest":
+            npx_args.insert(0, "--prefer-offline")
+
         return StdioServerParameters(
             command="npx",
-            args=args,
+            args=npx_args,
             env=env,
         )
 
-    async def connect(self) -> ClientSession:
+    async def connect(self) -> "ClientSession":
         """
         Establish stdio connection to Sentry MCP server.
 
         Spawns the server as a subprocess and initializes the MCP session.
+        The connection stays open until close() is called.
 
         Returns:
             Initialized ClientSession ready for tool calls
@@ -71,13 +122,35 @@ class SentryMCPConnector:
         Raises:
             Exception: If server fails to start or connection fails
         """
+        if self._session:
+            return self._session
+
+        from mcp import ClientSession
+        from mcp.client.stdio import stdio_client
+
         server_params = self._build_server_params()
 
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                self._session = session
-                return session
+        exit_stack = AsyncExitStack()
+        try:
+            read, write = await exit_stack.enter_async_context(stdio_client(server_params))
+            session = await exit_stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+
+        self._exit_stack = exit_stack
+        self._session = session
+        return session
+
+    async def close(self) -> None:
+        """
+        Close the MCP session and terminate the server subprocess.
+        """
+        exit_stack, self._exit_stack = self._exit_stack, None
+        self._session = None
+        if exit_stack:
+            await exit_stack.aclose()
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """
@@ -90,14 +163,13 @@ class SentryMCPConnector:
         Returns:
             Tool execution result
 
+        Connects on first use if connect() has not been called yet.
+
         Raises:
-            RuntimeError: If session is not initialized
             Exception: If tool call fails
         """
-        if not self._session:
-            raise RuntimeError("MCP session not initialized. Call connect() first.")
-
-        result = await self._session.call_tool(tool_name, arguments)
+        session = await self.connect()
+        result = await session.call_tool(tool_name, arguments)
         return result
 
     async def list_tools(self) -> List[Any]:
@@ -107,13 +179,10 @@ class SentryMCPConnector:
         Returns:
             List of tool definitions with names, descriptions, and schemas
 
-        Raises:
-            RuntimeError: If session is not initialized
+        Connects on first use if connect() has not been called yet.
         """
-        if not self._session:
-            raise RuntimeError("MCP session not initialized. Call connect() first.")
-
-        tools_response = await self._session.list_tools()
+        session = await self.connect()
+        tools_response = await session.list_tools()
         return tools_response.tools
 
 
@@ -121,11 +190,13 @@ async def execute_tool(
     settings: Settings,
     tool_name: str,
     arguments: Dict[str, Any],
+    connector: Optional[SentryMCPConnector] = None,
 ) -> Any:
     """
     Helper function to execute a single tool call with automatic connection management.
 
-    This function handles the full lifecycle:
+    If an already-connected connector is given, the call reuses its session.
+    Otherwise this function handles the full lifecycle:
     1. Spawn MCP server subprocess
     2. Connect via stdio
     3. Call the tool
@@ -136,6 +207,7 @@ async def execute_tool(
         settings: Application settings
         tool_name: Name of the MCP tool to call
         arguments: Tool arguments
+        connector: Optional connected connector to reuse
 
     Returns:
         Tool execution result
@@ -148,21 +220,23 @@ async def execute_tool(
         ...     {"query": "my-org"}
         ... )
     """
-    connector = SentryMCPConnector(settings)
+    if connector:
+        return await connector.call_tool(tool_name, arguments)
 
-    async with stdio_client(connector._build_server_params()) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            result = await session.call_tool(tool_name, arguments)
-            return result
+    async with SentryMCPConnector(settings) as connector:
+        return await connector.call_tool(tool_name, arguments)
 
 
-async def list_all_tools(settings: Settings) -> List[Any]:
+async def list_all_tools(
+    settings: Settings,
+    connector: Optional[SentryMCPConnector] = None,
+) -> List[Any]:
     """
     Helper function to list all available tools with automatic connection management.
 
     Args:
         settings: Application settings
+        connector: Optional connected connector to reuse
 
     Returns:
         List of tool definitions
@@ -173,10 +247,114 @@ async def list_all_tools(settings: Settings) -> List[Any]:
         >>> for tool in tools:
         ...     print(f"{tool.name}: {tool.description}")
     """
-    connector = SentryMCPConnector(settings)
+    if connector:
+        return await connector.list_tools()
 
-    async with stdio_client(connector._build_server_params()) as (read, write):
-        async with ClientSession(read, write) as session:
-            await session.initialize()
-            tools_response = await session.list_tools()
-            return tools_response.tools
+    async with SentryMCPConnector(settings) as connector:
+        return await connector.list_tools()
+
+
+def _tools_cache_path() -> Path:
+    """Location of the on-disk tool list cache (honours XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "sentry-cli" / "tools.json"
+
+
+def _tools_cache_key(settings: Settings) -> List[Any]:
+    """
+    Cache key covering every setting that changes the server's tool list.
+
+    The access token is included as a hash (never the raw token) since its
+    scopes decide which tools are exposed, and an OpenAI key enables the
+    AI-powered search tools.
+    """
+    server = settings.sentry_mcp_server_path or _server_package_spec(settings)
+    token_hash = hashlib.sha256(settings.sentry_access_token.encode()).hexdigest()
+    return [
+        settings.sentry_host,
+        settings.sentry_default_org,
+        server,
+        token_hash,
+        bool(settings.openai_api_key),
+    ]
+
+
+def _read_tools_cache(settings: Settings, ttl: int) -> Optional[List[SimpleNamespace]]:
+    """Return cached tools if the cache file is fresh and matches settings, else None."""
+    path = _tools_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    # Treat any malformed cache file as a miss
+    if not isinstance(data, dict) or data.get("key") != _tools_cache_key(settings):
+        return None
+
+    try:
+        return [SimpleNamespace(**tool) for tool in data["tools"]]
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_tools_cache(settings: Settings, tools: List[Any]) -> None:
+    """Atomically persist the tool list; cache write failures are not fatal."""
+    path = _tools_cache_path()
+    data = {
+        "key": _tools_cache_key(settings),
+        "tools": [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": getattr(tool, "inputSchema", None),
+            }
+            for tool in tools
+        ],
+    }
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+async def list_cached_tools(
+    settings: Settings,
+    connector: Optional[SentryMCPConnector] = None,
+    ttl: int = TOOLS_CACHE_TTL,
+    use_cache: bool = True,
+) -> List[Any]:
+    """
+    List all available tools, served from the on-disk cache when fresh.
+
+    Tool metadata only changes with the server package version, so the
+    list_tools response is stored under ~/.cache/sentry-cli/tools.json and
+    reused for ``ttl`` seconds. On a cache hit no server is spawned.
+
+    Args:
+        settings: Application settings
+        connector: Optional connector to reuse on a cache miss
+        ttl: Maximum cache age in seconds
+        use_cache: Set to False to bypass the cache and always query the server
+
+    Returns:
+        List of tool definitions with name, description and inputSchema attributes
+    """
+    if use_cache:
+        tools = _read_tools_cache(settings, ttl)
+        if tools is not None:
+            return tools
+
+    tools = await list_all_tools(settings, connector)
+    _write_tools_cache(settings, tools)
+    return tools